@@ -1,30 +1,57 @@
+import atexit
+import logging
 import os
+import time
 from typing import List, Dict, Any, Optional
 import asyncio
-import json
 from dotenv import load_dotenv
+import orjson
 import httpx
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, TypeAdapter
 from fastmcp import FastMCP
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Configuration
 API_BASE_URL = os.getenv("CATALYST_API_BASE_URL", "https://sandboxdnac.cisco.com/dna/intent/api/v1")
+AUTH_URL = os.getenv("CATALYST_AUTH_URL", "https://sandboxdnac.cisco.com/dna/system/api/v1/auth/token")
 API_TOKEN = os.getenv("CATALYST_API_TOKEN")
+API_USERNAME = os.getenv("CATALYST_USERNAME")
+API_PASSWORD = os.getenv("CATALYST_PASSWORD")
 
-if not API_TOKEN:
-    raise ValueError("CATALYST_API_TOKEN environment variable is required")
+if not API_TOKEN and not (API_USERNAME and API_PASSWORD):
+    raise ValueError("CATALYST_API_TOKEN or CATALYST_USERNAME/CATALYST_PASSWORD "
+                     "environment variables are required")
 
 
 HEADERS = {
-    "X-Auth-Token": API_TOKEN,
     "Content-Type": "application/json",
     "Accept": "application/json"
 }
 
-# Pydantic models for validation
+# Relative API paths, joined onto the client's base_url. Constants keep the
+# fixed endpoints out of per-call f-string formatting.
+_EP_SITE = "site"
+_EP_DEVICES = "network-device"
+_EP_TASK = "task"
+_EP_TASK_BULK = "task/bulk"
+
+def _to_json(obj: Any, pretty: bool = False) -> str:
+    """
+    Serialize a response payload with orjson.
+
+    Compact by default: the MCP transport does not need pretty printing, and
+    orjson's C encoder is roughly an order of magnitude faster than stdlib
+    json on large list-of-dict inventories.
+    """
+    option = orjson.OPT_INDENT_2 if pretty else 0
+    return orjson.dumps(obj, option=option).decode()
+
+# Pydantic models for validation. Aliases map the Catalyst Center field names
+# so raw response items validate directly, with no hand-written projection.
 class Site(BaseModel):
     id: str
     name: str
@@ -35,11 +62,11 @@ class Device(BaseModel):
     hostname: str
     family: str
     role: str
-    ip_address: Optional[str] = None
+    ip_address: Optional[str] = Field(None, alias="managementIpAddress")
 
 class Endpoint(BaseModel):
     mac: Optional[str] = None
-    ip_address: Optional[str] = None
+    ip_address: Optional[str] = Field(None, alias="ipAddress")
     username: Optional[str] = None
 
 class DeviceDetails(BaseModel):
@@ -49,38 +76,270 @@ class DeviceDetails(BaseModel):
     serial_number: Optional[str] = None
     status: Optional[str] = None
 
-class TaskResult(BaseModel):
-    task_id: Optional[str] = None
-    status: Optional[str] = None
+# List adapters are compiled once at import; validating a whole response list
+# through the pydantic-core schema is far cheaper than a Python __init__ per item.
+_SITES_ADAPTER = TypeAdapter(List[Site])
+_DEVICES_ADAPTER = TypeAdapter(List[Device])
+_ENDPOINTS_ADAPTER = TypeAdapter(List[Endpoint])
 
 # Initialize FastMCP server
 mcp = FastMCP("catalyst_center_mcp")
 
+# Shared HTTP client so connections to Catalyst Center are pooled and reused
+# across tool calls instead of paying a TCP+TLS handshake per request.
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+async def _get_client() -> httpx.AsyncClient:
+    """
+    Return the shared httpx.AsyncClient, creating it on first use.
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.AsyncClient(
+            base_url=API_BASE_URL,
+            # Inventory responses compress well (repeated keys, hostnames,
+            # IPs); advertising gzip/brotli lets the server shrink them and
+            # httpx decompresses transparently.
+            headers={**HEADERS, "Accept-Encoding": "gzip, br"},
+            http2=True,
+            verify=False,  # SSL certificate verification disabled for the sandbox
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60),
+        )
+    return _CLIENT
+
+def _close_client() -> None:
+    """
+    Close the shared client at interpreter exit so pooled connections shut down cleanly.
+    """
+    if _CLIENT is not None:
+        try:
+            asyncio.run(_CLIENT.aclose())
+        except RuntimeError:
+            pass  # Event loop already closed; connections die with the process.
+
+atexit.register(_close_client)
+
+# Catalyst Center tokens are short-lived, so rather than baking one into the
+# client at import we cache it and refresh through /auth/token before expiry
+# (or on a 401). The lock makes refresh single-flight: 100 concurrent tool
+# calls trigger one POST, not 100.
+_TOKEN: Optional[str] = None
+_TOKEN_EXP: float = 0.0
+_TOKEN_LOCK = asyncio.Lock()
+_TOKEN_LIFETIME = 3300.0  # server tokens last ~1h; renew with headroom
+
+async def _get_token() -> str:
+    """
+    Return a valid X-Auth-Token, refreshing it if within a minute of expiry.
+    """
+    global _TOKEN, _TOKEN_EXP
+    async with _TOKEN_LOCK:
+        if _TOKEN is not None and time.time() < _TOKEN_EXP - 60:
+            return _TOKEN
+        if not (API_USERNAME and API_PASSWORD):
+            # No credentials to refresh with; use the static token as-is.
+            _TOKEN = API_TOKEN
+            _TOKEN_EXP = float("inf")
+            return _TOKEN
+        client = await _get_client()
+        response = await client.post(AUTH_URL, auth=(API_USERNAME, API_PASSWORD))
+        response.raise_for_status()
+        _TOKEN = orjson.loads(await response.aread())["Token"]
+        _TOKEN_EXP = time.time() + _TOKEN_LIFETIME
+        return _TOKEN
+
+def _invalidate_token() -> None:
+    """
+    Force the next _get_token call to refresh (e.g. after a 401).
+    """
+    global _TOKEN_EXP
+    _TOKEN_EXP = 0.0
+
+class AsyncLimiter:
+    """
+    Token-bucket rate limiter for asyncio callers.
+
+    The bucket holds up to `max_rate` tokens and refills continuously at
+    `max_rate / time_period` tokens per second, so short bursts go through
+    immediately while sustained load is smoothed below the API quota.
+    """
+
+    def __init__(self, max_rate: int, time_period: float = 1.0):
+        self.max_rate = max_rate
+        self._rate_per_sec = max_rate / time_period
+        self._level = float(max_rate)
+        self._last_check = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._level = min(self.max_rate, self._level + self._rate_per_sec * (now - self._last_check))
+        self._last_check = now
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            self._refill()
+            while self._level < 1:
+                await asyncio.sleep((1 - self._level) / self._rate_per_sec)
+                self._refill()
+            self._level -= 1
+
+    async def __aenter__(self) -> "AsyncLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        pass
+
+# Proactive limiter so concurrent tool calls never slam the API into 429s.
+# Clamped to at least 1: a user-supplied CATALYST_RPS of 0 would otherwise
+# divide by zero in acquire() and fail every request.
+_LIMITER = AsyncLimiter(max_rate=max(1, int(os.getenv("CATALYST_RPS", "10"))), time_period=1)
+_MAX_RETRIES = 3
+
+# Short-lived cache for idempotent GETs so bursts of identical tool calls
+# collapse to a single round trip. Inventories change on the order of minutes,
+# so a small TTL is safe and takes pressure off the API rate limit.
+_CACHE: Dict[tuple, tuple] = {}
+_CACHE_TTL = 30.0
+_CACHE_MAX_ENTRIES = 500
+
+async def _cached_get(endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+    """
+    GET an endpoint through make_api_request, serving repeats within the TTL from cache.
+    """
+    key = (endpoint, tuple(sorted((params or {}).items())))
+    cached = _CACHE.get(key)
+    if cached is not None:
+        ts, result = cached
+        if time.monotonic() - ts < _CACHE_TTL:
+            return result
+    result = await make_api_request("GET", endpoint, params=params)
+    if "error" not in result:
+        if len(_CACHE) >= _CACHE_MAX_ENTRIES:
+            _CACHE.pop(next(iter(_CACHE)))  # FIFO eviction keeps the cache bounded
+        _CACHE[key] = (time.monotonic(), result)
+    return result
+
+# Task submissions are funneled through a queue and coalesced over a short
+# window, so a burst of run_automation_task calls becomes one bulk POST
+# instead of N serialized ones.
+_TASK_BATCH_WINDOW = 0.05
+_TASK_QUEUE: Optional[asyncio.Queue] = None
+_TASK_WORKER: Optional[asyncio.Task] = None
+# Not every deployment exposes task/bulk; flipped off on the first 404/405 so
+# later batches go straight to individual submissions.
+_TASK_BULK_SUPPORTED = True
+
+async def _submit_task(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Queue a task payload for the batching worker and wait for its result.
+    """
+    global _TASK_QUEUE, _TASK_WORKER
+    if _TASK_QUEUE is None:
+        _TASK_QUEUE = asyncio.Queue()
+        _TASK_WORKER = asyncio.get_event_loop().create_task(_task_worker())
+    fut = asyncio.get_event_loop().create_future()
+    await _TASK_QUEUE.put((payload, fut))
+    return await fut
+
+async def _task_worker() -> None:
+    """
+    Drain the task queue, batching submissions that arrive within the window.
+
+    A lone task is POSTed to `task` unchanged; two or more are sent as one
+    array body to `task/bulk` and the per-task results fanned back out to
+    their futures. If the deployment turns out not to support task/bulk,
+    batched items fall back to individual submissions.
+    """
+    global _TASK_BULK_SUPPORTED
+    while True:
+        items = [await _TASK_QUEUE.get()]
+        await asyncio.sleep(_TASK_BATCH_WINDOW)
+        while True:
+            try:
+                items.append(_TASK_QUEUE.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        if len(items) > 1 and _TASK_BULK_SUPPORTED:
+            result = await make_api_request("POST", _EP_TASK_BULK,
+                                            data={"tasks": [payload for payload, _ in items]})
+            error = result.get("error")
+            if not (error and (error.startswith("API error: 404") or
+                               error.startswith("API error: 405"))):
+                per_task = result.get("response") if error is None else None
+                for i, (_, fut) in enumerate(items):
+                    if fut.done():
+                        continue
+                    if isinstance(per_task, list) and len(per_task) == len(items):
+                        fut.set_result(per_task[i])
+                    else:
+                        fut.set_result(result)
+                continue
+            _TASK_BULK_SUPPORTED = False
+        # Individual submissions fan out concurrently, same pattern as the
+        # bulk GET tools, so a burst never serializes behind the worker.
+        sem = asyncio.Semaphore(10)
+
+        async def _one(payload: Dict[str, Any], fut: asyncio.Future) -> None:
+            async with sem:
+                result = await make_api_request("POST", _EP_TASK, data=payload)
+            if not fut.done():
+                fut.set_result(result)
+
+        await asyncio.gather(*[_one(payload, fut) for payload, fut in items])
+
 # Helper for API calls with rate limiting and error handling
 async def make_api_request(method: str, endpoint: str, params: Optional[Dict] = None, data: Optional[Dict] = None) -> Dict[str, Any]:
     """
     Make an authenticated request to the Catalyst Center API with SSL verification disabled.
     """
-    url = f"{API_BASE_URL}/{endpoint.lstrip('/')}"
     try:
-        # --- CHANGE MADE HERE: verify=False to disable SSL certificate verification ---
-        async with httpx.AsyncClient(verify=False, timeout=30.0) as client:
-            response = await client.request(method, url, headers=HEADERS, params=params, json=data)
+        client = await _get_client()
+        auth_retried = False
+        for attempt in range(_MAX_RETRIES + 1):
+            headers = {"X-Auth-Token": await _get_token()}
+            async with _LIMITER:
+                response = await client.request(method, endpoint, params=params,
+                                                json=data, headers=headers)
+            if response.status_code == 401 and not auth_retried and API_USERNAME and API_PASSWORD:
+                # Token likely expired mid-lifetime; refresh once and retry.
+                auth_retried = True
+                _invalidate_token()
+                continue
+            if response.status_code == 429 and attempt < _MAX_RETRIES:
+                # Honor a numeric Retry-After if present, else back off
+                # exponentially (the header may also be an HTTP-date, RFC 9110).
+                try:
+                    delay = float(response.headers["Retry-After"])
+                except (KeyError, ValueError):
+                    delay = 2 ** attempt
+                await asyncio.sleep(delay)
+                continue
             response.raise_for_status()
-            return response.json()
+            # orjson decodes straight from bytes, skipping the bytes -> str
+            # round trip stdlib json forces and keeping the decode off the
+            # event loop for longer than it needs to be.
+            return orjson.loads(await response.aread())
+        # Retry budget exhausted (e.g. 429s followed by a 401 refresh retry
+        # on the last attempt); surface the final response as an error.
+        response.raise_for_status()
+        return {"error": f"API error: {response.status_code} - {response.text}"}
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 401:
             return {"error": "Authentication failed. Check your API token."}
         elif e.response.status_code == 429:
-            await asyncio.sleep(1)  # Rate limit delay
             return {"error": "Rate limit exceeded. Please try again later."}
         else:
             return {"error": f"API error: {e.response.status_code} - {e.response.text}"}
     except httpx.RequestError as e:
-        print(f"DEBUG: httpx.RequestError encountered: {e}") # Keep for debugging network issues
+        # %-style defers formatting until the level is enabled; never print to
+        # stdout here, since stdio transport uses it as the MCP channel.
+        logger.debug("httpx error: %r", e)
         return {"error": f"Network error: {str(e)}"}
     except Exception as e:
-        print(f"DEBUG: Unexpected error encountered: {e}") # Keep for debugging unexpected errors
+        logger.debug("unexpected error: %r", e)
         return {"error": f"Unexpected error: {str(e)}"}
 
 @mcp.tool()
@@ -91,16 +350,15 @@ async def get_sites() -> str:
     Returns:
         A JSON-formatted string listing sites with ID, name, and description.
     """
-    data = await make_api_request("GET", "site")
+    data = await _cached_get(_EP_SITE)
     if "error" in data:
-        return json.dumps({"error": data["error"]}, indent=2)
+        return _to_json({"error": data["error"]})
     
-    sites = [Site(id=site["id"], name=site["name"], description=site.get("description")).dict() 
-             for site in data.get("response", [])]
+    sites = _SITES_ADAPTER.dump_python(_SITES_ADAPTER.validate_python(data.get("response", [])))
     if not sites:
-        return json.dumps({"message": "No sites found."}, indent=2)
+        return _to_json({"message": "No sites found."})
     
-    return json.dumps(sites, indent=2)
+    return _to_json(sites)
 
 @mcp.tool()
 async def get_devices(site_id: Optional[str] = None) -> str:
@@ -114,17 +372,15 @@ async def get_devices(site_id: Optional[str] = None) -> str:
         A JSON-formatted string listing devices with hostname, family, role, and IP.
     """
     params = {"siteId": site_id} if site_id else None
-    data = await make_api_request("GET", "network-device", params=params)
+    data = await _cached_get(_EP_DEVICES, params=params)
     if "error" in data:
-        return json.dumps({"error": data["error"]}, indent=2)
+        return _to_json({"error": data["error"]})
     
-    devices = [Device(id=dev["id"], hostname=dev["hostname"], family=dev["family"], 
-                      role=dev["role"], ip_address=dev.get("managementIpAddress")).dict() 
-               for dev in data.get("response", [])]
+    devices = _DEVICES_ADAPTER.dump_python(_DEVICES_ADAPTER.validate_python(data.get("response", [])))
     if not devices:
-        return json.dumps({"message": "No devices found."}, indent=2)
+        return _to_json({"message": "No devices found."})
     
-    return json.dumps(devices, indent=2)
+    return _to_json(devices)
 
 @mcp.tool()
 async def get_endpoints(device_id: str) -> str:
@@ -137,16 +393,38 @@ async def get_endpoints(device_id: str) -> str:
     Returns:
         A JSON-formatted string listing endpoints with MAC, IP, and username.
     """
-    data = await make_api_request("GET", f"device/{device_id}/endpoint")
+    data = await _cached_get(f"device/{device_id}/endpoint")
     if "error" in data:
-        return json.dumps({"error": data["error"]}, indent=2)
+        return _to_json({"error": data["error"]})
     
-    endpoints = [Endpoint(mac=ep.get("mac"), ip_address=ep.get("ipAddress"), username=ep.get("username")).dict() 
-                 for ep in data.get("response", [])]
+    endpoints = _ENDPOINTS_ADAPTER.dump_python(_ENDPOINTS_ADAPTER.validate_python(data.get("response", [])))
     if not endpoints:
-        return json.dumps({"message": "No endpoints found for this device."}, indent=2)
+        return _to_json({"message": "No endpoints found for this device."})
     
-    return json.dumps(endpoints, indent=2)
+    return _to_json(endpoints)
+
+# Hostname/family/serial/software are effectively immutable per device, so the
+# projection is cached per device_id; only reachabilityStatus is read fresh
+# from each response. (Catalyst Center has no lighter status-only view of
+# network-device/{id}, so the full resource is still fetched.)
+_DEVICE_STATIC: Dict[str, Dict[str, Any]] = {}
+
+def _project_device_details(device_id: str, device: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the device-details payload, reusing the cached static fields.
+    """
+    static = _DEVICE_STATIC.get(device_id)
+    if static is None:
+        static = {
+            "hostname": device.get("hostname", "N/A"),
+            "family": device.get("family", "N/A"),
+            "software_version": device.get("softwareVersion"),
+            "serial_number": device.get("serialNumber"),
+        }
+        if len(_DEVICE_STATIC) >= _CACHE_MAX_ENTRIES:
+            _DEVICE_STATIC.pop(next(iter(_DEVICE_STATIC)))  # FIFO eviction keeps the cache bounded
+        _DEVICE_STATIC[device_id] = static
+    return {**static, "status": device.get("reachabilityStatus")}
 
 @mcp.tool()
 async def get_device_details(device_id: str) -> str:
@@ -159,19 +437,107 @@ async def get_device_details(device_id: str) -> str:
     Returns:
         A JSON-formatted string with device details (hostname, family, software version, serial number, status).
     """
-    data = await make_api_request("GET", f"network-device/{device_id}")
+    data = await _cached_get(f"{_EP_DEVICES}/{device_id}")
     if "error" in data:
-        return json.dumps({"error": data["error"]}, indent=2)
-    
-    device = data.get("response", {})
-    details = DeviceDetails(
-        hostname=device.get("hostname", "N/A"),
-        family=device.get("family", "N/A"),
-        software_version=device.get("softwareVersion"),
-        serial_number=device.get("serialNumber"),
-        status=device.get("reachabilityStatus")
-    ).dict()
-    return json.dumps(details, indent=2)
+        return _to_json({"error": data["error"]})
+
+    return _to_json(_project_device_details(device_id, data.get("response", {})))
+
+@mcp.tool()
+async def get_devices_details_bulk(device_ids: List[str]) -> str:
+    """
+    Get detailed information for multiple devices in one call.
+
+    The per-device lookups are issued concurrently (bounded at 10 in flight)
+    instead of one round trip at a time.
+
+    Args:
+        device_ids: List of device IDs to query.
+
+    Returns:
+        A JSON-formatted string mapping each device ID to its details.
+    """
+    sem = asyncio.Semaphore(10)
+
+    async def _one(did: str):
+        async with sem:
+            return did, await make_api_request("GET", f"{_EP_DEVICES}/{did}")
+
+    results = await asyncio.gather(*[_one(d) for d in device_ids])
+    details_by_id = {}
+    for did, data in results:
+        if "error" in data:
+            details_by_id[did] = {"error": data["error"]}
+            continue
+        details_by_id[did] = _project_device_details(did, data.get("response", {}))
+    return _to_json(details_by_id)
+
+@mcp.tool()
+async def get_endpoints_bulk(device_ids: List[str]) -> str:
+    """
+    Retrieve endpoints (clients) for multiple devices in one call.
+
+    Args:
+        device_ids: List of device IDs to query endpoints for.
+
+    Returns:
+        A JSON-formatted string mapping each device ID to its endpoint list.
+    """
+    sem = asyncio.Semaphore(10)
+
+    async def _one(did: str):
+        async with sem:
+            return did, await make_api_request("GET", f"device/{did}/endpoint")
+
+    results = await asyncio.gather(*[_one(d) for d in device_ids])
+    endpoints_by_id = {}
+    for did, data in results:
+        if "error" in data:
+            endpoints_by_id[did] = {"error": data["error"]}
+            continue
+        endpoints_by_id[did] = _ENDPOINTS_ADAPTER.dump_python(
+            _ENDPOINTS_ADAPTER.validate_python(data.get("response", [])))
+    return _to_json(endpoints_by_id)
+
+@mcp.tool()
+async def get_inventory(max_concurrency: int = 10) -> str:
+    """
+    Retrieve the full inventory: every site with its devices and a device count.
+
+    Fuses the "list sites, then list each site's devices" workflow into one
+    call, fetching all per-site device lists concurrently instead of paying
+    1 + N serial round trips.
+
+    Args:
+        max_concurrency: Maximum number of per-site device requests in flight.
+
+    Returns:
+        A JSON-formatted string with sites, each carrying its device list and count.
+    """
+    data = await _cached_get(_EP_SITE)
+    if "error" in data:
+        return _to_json({"error": data["error"]})
+
+    sites = _SITES_ADAPTER.dump_python(_SITES_ADAPTER.validate_python(data.get("response", [])))
+    # Clamp agent-supplied concurrency: Semaphore(0) or a negative value
+    # would block every fetch forever.
+    sem = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _site_devices(site_id: str):
+        async with sem:
+            return await _cached_get(_EP_DEVICES, params={"siteId": site_id})
+
+    device_results = await asyncio.gather(*[_site_devices(s["id"]) for s in sites])
+    for site, result in zip(sites, device_results):
+        if "error" in result:
+            site["devices"] = []
+            site["device_count"] = 0
+            site["error"] = result["error"]
+            continue
+        site["devices"] = _DEVICES_ADAPTER.dump_python(
+            _DEVICES_ADAPTER.validate_python(result.get("response", [])))
+        site["device_count"] = len(site["devices"])
+    return _to_json({"sites": sites, "site_count": len(sites)})
 
 @mcp.tool()
 async def run_automation_task(task_type: str, params: Dict[str, Any]) -> str:
@@ -185,16 +551,15 @@ async def run_automation_task(task_type: str, params: Dict[str, Any]) -> str:
     Returns:
         A JSON-formatted string with task execution result or status.
     """
-    data = await make_api_request("POST", "task", data={"taskType": task_type, "params": params})
+    data = await _submit_task({"taskType": task_type, "params": params})
     if "error" in data:
-        return json.dumps({"error": data["error"]}, indent=2)
+        return _to_json({"error": data["error"]})
     
-    result = TaskResult(task_id=data.get("taskId"), status=data.get("progress")).dict()
-    return json.dumps({
+    return _to_json({
         "status": "success",
-        "task_id": result["task_id"],
-        "progress": result["status"]
-    }, indent=2)
+        "task_id": data.get("taskId"),
+        "progress": data.get("progress")
+    })
 
 @mcp.resource("greeting: //{name}")
 def greeting(name: str) -> str:
@@ -210,5 +575,9 @@ def greeting(name: str) -> str:
     return f"Hello {name}!"
 
 if __name__ == "__main__":
+    try:
+        import uvloop  # libuv-backed loop: lower per-request scheduling cost
+        uvloop.install()
+    except ImportError:
+        pass  # Not available on Windows; the default loop works fine.
     mcp.run(transport="stdio") # Use stdio for Claude Desktop integration
-    uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -11,11 +11,13 @@ setup(
     url="https://github.com/your-username/catalyst-center-mcp",
     packages=find_packages(),
     install_requires=[
-        "fastapi==0.103.2",
-        "uvicorn==0.23.2",
-        "requests==2.31.0",
+        "httpx[http2]==0.27.2",
+        "orjson>=3.9.0",
+        "brotli>=1.1.0",
         "pydantic==2.4.2",
+        "fastmcp>=0.4.0",
         "python-dotenv==1.0.0",
+        'uvloop; platform_system != "Windows"',
     ],
     classifiers=[
         "Programming Language :: Python :: 3",